@@ -9,13 +9,19 @@ Google Drive (public folder) -> GitHub Pages static site builder (no Jekyll).
 
 Also writes:
 - docs/manifest.json
+- content/drive/.manifest.json (Drive file id -> md5, keeps unchanged files untouched on re-sync)
+- .cache/docx-v1/<sha256>/ (conversion cache; persist it between CI runs to skip mammoth/soffice;
+  entries unused for DOCX_CACHE_MAX_AGE_DAYS are evicted after a successful build)
 - docs/_ci/build_site.log + docs/_ci/failure.json (on failures)
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
+import html
 import inspect
+import io
 import json
 import logging
 import os
@@ -24,15 +30,22 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
 
-import gdown
-import mammoth
-from bs4 import BeautifulSoup
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json produces the same document
+    orjson = None  # type: ignore[assignment]
 
 ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = ROOT / "content" / "drive"
@@ -42,9 +55,45 @@ OUT_NOTES = DOCS_DIR / "notes"
 OUT_DOWNLOADS = DOCS_DIR / "downloads"
 OUT_ASSETS = DOCS_DIR / "assets"
 OUT_CI = DOCS_DIR / "_ci"
+SITE_CSS = OUT_ASSETS / "site.css"
+
+SYNC_MANIFEST = ".manifest.json"
+GSUITE_STUBS = (".gdoc", ".gsheet", ".gslides")
+# content-addressed conversion cache (DOCX sha256 -> mammoth body + images, soffice PDF); bump on format change
+DOCX_CACHE_DIR = ROOT / ".cache" / "docx-v1"
+CACHE_IMG_HREF = "@@IMG@@"
+DOCX_CACHE_MAX_AGE_DAYS = 30
+PAGE_FORMAT = 1  # bump whenever the page template changes: pages from older builds are then rebuilt
+DOCX_READ_ONCE_MAX = 50 << 20  # larger DOCX files are not held in memory whole
+IMAGE_WORKERS = 4
+SNIFF_WORKERS = 32
 
 LOG = logging.getLogger("build_site")
 
+PAGE_CSS = """
+      body{font-family:system-ui,-apple-system,Segoe UI,Roboto,Arial,sans-serif;line-height:1.6;margin:0;background:#fff}
+      .wrap{max-width:980px;margin:0 auto;padding:24px}
+      .topbar{position:sticky;top:0;background:#fff;border-bottom:1px solid #eee}
+      .topbar .wrap{display:flex;gap:12px;align-items:center;justify-content:space-between}
+      .btns{display:flex;gap:10px;flex-wrap:wrap}
+      a.btn{display:inline-block;padding:10px 12px;border:1px solid #ddd;border-radius:12px;text-decoration:none;color:inherit}
+      a.btn:hover{background:#fafafa}
+      .card{border:1px solid #eee;border-radius:16px;padding:16px}
+      ul{padding-left:18px}
+      img{max-width:100%;height:auto}
+      table{border-collapse:collapse;width:100%;overflow-x:auto;display:block}
+      th,td{border:1px solid #ddd;padding:8px}
+      pre,code{background:#f6f8fa;border-radius:8px}
+      pre{padding:12px;overflow:auto}
+      hr{border:none;border-top:1px solid #eee;margin:18px 0}
+      details{border:1px solid #eee;border-radius:16px;padding:12px}
+      summary{cursor:pointer}
+    """
+
+DOCX_HTML_SECTION_TAIL = """
+          </details>
+        """
+
 
 @dataclass(frozen=True)
 class Entry:
@@ -66,6 +115,7 @@ def main() -> None:
 
     entries: List[Entry] = []
     current_entry: Optional[Entry] = None
+    src_files: Optional[List[Path]] = None
 
     try:
         do_sync = args.all or args.sync_drive
@@ -73,28 +123,77 @@ def main() -> None:
 
         if do_sync:
             url = require_env_url()
-            sync_drive_folder(url, SRC_DIR)
-            normalize_downloaded_files(SRC_DIR)
-            assert_has_docs(SRC_DIR)
+            sync_drive_folder(url, SRC_DIR, jobs=args.sync_jobs, retries=args.sync_retries)
+            # one walk of the synced tree, reused by the checks below and by collect_entries
+            src_files = normalize_downloaded_files(SRC_DIR)
+            assert_has_docs(src_files)
 
         if do_build:
             ensure_dirs()
-            if not args.no_clean:
+            build_options = {"lang": args.lang, "docx_render": args.docx_render, "page_format": PAGE_FORMAT}
+            # outputs from a previous build can only be reused if it finished and rendered them the same way
+            previous = read_previous_manifest()
+            incremental = (
+                not args.clean and previous.get("status") == "success" and previous.get("options") == build_options
+            )
+            built_from = previous_sources(previous) if incremental else {}
+            if args.clean or not (incremental or args.no_clean):
                 clean_generated_dirs()
 
-            entries = collect_entries(SRC_DIR)
-            write_manifest(entries, status="collected", error=None, current_entry=None)
-
-            for e in entries:
-                current_entry = e
-                LOG.info("[build] %s -> %s", e.src, e.out_html)
-                if e.kind == "docx":
-                    build_docx(e, lang=args.lang, docx_render=args.docx_render)
-                else:
-                    build_pdf(e, lang=args.lang)
+            entries = collect_entries(SRC_DIR, src_files)
+            if incremental and not args.no_clean:
+                prune_stale_outputs(entries)
+            write_site_css()
+            write_manifest(entries, status="collected", error=None, current_entry=None, options=build_options)
+
+            # only DOCX conversion is worth a worker; a PDF entry is a hardlink plus a small page
+            docx_entries = [e for e in entries if e.kind == "docx"]
+            if args.jobs <= 1 or len(docx_entries) <= 1:
+                for e in entries:
+                    current_entry = e
+                    build_entry(
+                        e,
+                        lang=args.lang,
+                        docx_render=args.docx_render,
+                        incremental=incremental,
+                        built_from=built_from.get(str(e.out_html)),
+                    )
+            else:
+                LOG.info("[build] parallel jobs=%d (%s)", args.jobs, "threads" if args.threads else "processes")
+                with make_build_pool(args, log_file) as ex:
+                    futures = {
+                        ex.submit(
+                            build_entry,
+                            e,
+                            lang=args.lang,
+                            docx_render=args.docx_render,
+                            incremental=incremental,
+                            built_from=built_from.get(str(e.out_html)),
+                        ): e
+                        for e in docx_entries
+                    }
+                    try:
+                        # PDF entries run here while the pool converts
+                        for e in entries:
+                            if e.kind != "docx":
+                                current_entry = e
+                                build_entry(
+                                    e,
+                                    lang=args.lang,
+                                    docx_render=args.docx_render,
+                                    incremental=incremental,
+                                    built_from=built_from.get(str(e.out_html)),
+                                )
+                        for fut in as_completed(futures):
+                            current_entry = futures[fut]
+                            fut.result()
+                    except BaseException:
+                        ex.shutdown(wait=True, cancel_futures=True)
+                        raise
 
             build_indexes(entries, lang=args.lang, site_title=args.site_title)
-            write_manifest(entries, status="success", error=None, current_entry=None)
+            prune_docx_cache(DOCX_CACHE_MAX_AGE_DAYS)
+            write_manifest(entries, status="success", error=None, current_entry=None, options=build_options)
 
     except SystemExit as e:
         on_failure(
@@ -116,12 +215,47 @@ def main() -> None:
         raise SystemExit(1) from e
 
 
+def make_build_pool(args: argparse.Namespace, log_file: Path) -> Executor:
+    if args.threads:
+        # shares this process (and its logging); suits small runners where soffice/disk I/O dominates
+        return ThreadPoolExecutor(max_workers=args.jobs)
+    return ProcessPoolExecutor(
+        max_workers=args.jobs,
+        initializer=init_build_worker,
+        initargs=(log_file, args.log_level, args.docx_render in {"html", "both"}),
+    )
+
+
+def init_build_worker(log_file: Path, level: str, preload_html: bool) -> None:
+    """Process-pool initializer: logging, plus the HTML-render imports paid once per worker, not per entry."""
+    configure_logging(log_file, level, announce=False)
+    if preload_html:
+        import mammoth  # noqa: F401  (cached in sys.modules for build_docx)
+
+        load_pyvips()
+
+
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--sync-drive", action="store_true", help="Download Drive folder into content/drive")
     p.add_argument("--build", action="store_true", help="Build docs/ site from content/drive")
     p.add_argument("--all", action="store_true", help="Run sync + build")
-    p.add_argument("--no-clean", action="store_true", help="Do not delete docs/{notes,downloads,assets} before build")
+    p.add_argument(
+        "--clean",
+        action="store_true",
+        help="Delete docs/{notes,downloads,assets} and rebuild everything (default: rebuild only changed entries)",
+    )
+    p.add_argument(
+        "--no-clean",
+        action="store_true",
+        help=(
+            "Never delete anything in docs/{notes,downloads,assets}: no cleaning when render options changed "
+            "and no pruning of outputs whose source is gone"
+        ),
+    )
+
+    p.add_argument("--sync-jobs", type=int, default=8, help="Concurrent Drive file downloads")
+    p.add_argument("--sync-retries", type=int, default=4, help="Download attempts per Drive file (exponential backoff)")
 
     p.add_argument("--lang", default="tr", help="HTML <html lang='...'>")
     p.add_argument("--site-title", default="FSP Notları", help="Root index title")
@@ -132,13 +266,25 @@ def parse_args() -> argparse.Namespace:
         help="How to render DOCX for reading pages",
     )
 
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Parallel build workers (processes); 1 = serial",
+    )
+    p.add_argument(
+        "--threads",
+        action="store_true",
+        help="Run the --jobs build workers as threads instead of processes (no fork/pickling cost)",
+    )
+
     p.add_argument("--log-file", default=str(OUT_CI / "build_site.log"), help="Log file path (for CI artifacts)")
     p.add_argument("--log-level", default="INFO", help="DEBUG|INFO|WARNING|ERROR")
     p.add_argument("--log-tail-lines", type=int, default=50, help="How many log lines to print on failure")
     return p.parse_args()
 
 
-def configure_logging(log_file: Path, level: str) -> None:
+def configure_logging(log_file: Path, level: str, announce: bool = True) -> None:
     log_file.parent.mkdir(parents=True, exist_ok=True)
 
     lvl = getattr(logging, level.upper(), logging.INFO)
@@ -158,7 +304,8 @@ def configure_logging(log_file: Path, level: str) -> None:
     LOG.addHandler(sh)
     LOG.addHandler(fh)
 
-    LOG.info("[init] log_file=%s level=%s", log_file, level.upper())
+    if announce:
+        LOG.info("[init] log_file=%s level=%s", log_file, level.upper())
 
 
 def on_failure(
@@ -186,7 +333,7 @@ def on_failure(
         "log_tail_lines": tail_lines,
         "log_tail": tail,
     }
-    (OUT_CI / "failure.json").write_text(json.dumps(failure_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json(OUT_CI / "failure.json", failure_payload)
 
     print("::error::build_site failed. See docs/_ci/failure.json and docs/_ci/build_site.log", file=sys.stderr)
     print(f"::group::Last {tail_lines} lines of build_site.log", file=sys.stderr)
@@ -194,6 +341,33 @@ def on_failure(
     print("::endgroup::", file=sys.stderr)
 
 
+def dumps_json(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@contextmanager
+def open_atomic(path: Path) -> Iterator[TextIO]:
+    """Text file that appears at path only once fully written: a killed run never leaves a truncated page
+    with a fresh mtime for is_up_to_date to accept."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as fp:
+            yield fp
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json(path: Path, payload: Any) -> None:
+    # write-then-rename: readers (and a crashed run) never see a half-written file
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(dumps_json(payload))
+    os.replace(tmp, path)
+
+
 def tail_file(path: Path, n: int) -> str:
     try:
         lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
@@ -216,6 +390,12 @@ def ensure_dirs() -> None:
     OUT_CI.mkdir(parents=True, exist_ok=True)
 
 
+def write_site_css() -> None:
+    # one shared stylesheet instead of an inline <style> per page; browsers cache it across notes
+    OUT_ASSETS.mkdir(parents=True, exist_ok=True)
+    SITE_CSS.write_text(inspect.cleandoc(PAGE_CSS) + "\n", encoding="utf-8")
+
+
 def clean_generated_dirs() -> None:
     for d in (OUT_NOTES, OUT_DOWNLOADS, OUT_ASSETS):
         if d.exists():
@@ -223,14 +403,50 @@ def clean_generated_dirs() -> None:
         d.mkdir(parents=True, exist_ok=True)
 
 
+def prune_stale_outputs(entries: List[Entry]) -> None:
+    """Incremental builds: drop generated files whose source no longer exists."""
+    keep: Set[Path] = {OUT_NOTES / "index.html", OUT_DOWNLOADS / "index.html"}
+    asset_dirs: Set[Path] = set()
+    # output dirs collect_entries just created for current entries (possibly still empty for a new Drive folder)
+    live_dirs: Set[Path] = set()
+    for e in entries:
+        keep.update((e.out_html, e.out_file))
+        live_dirs.update((e.out_html.parent, e.out_file.parent))
+        if e.kind == "docx":
+            keep.add(docx_pdf_target(e))
+            asset_dirs.add(OUT_ASSETS / e.rel_dir / e.rel_stem)
+
+    keep.add(SITE_CSS)
+
+    removed = 0
+    for p in [*iter_files(OUT_NOTES), *iter_files(OUT_DOWNLOADS)]:
+        if p not in keep:
+            p.unlink()
+            removed += 1
+    for p in list(iter_files(OUT_ASSETS)):
+        if p.parent not in asset_dirs and p not in keep:
+            p.unlink()
+            removed += 1
+
+    for d in (OUT_NOTES, OUT_DOWNLOADS, OUT_ASSETS):
+        for sub in sorted((x for x in d.rglob("*") if x.is_dir()), key=lambda x: len(x.parts), reverse=True):
+            if sub not in live_dirs and not any(sub.iterdir()):
+                sub.rmdir()
+
+    if removed:
+        LOG.info("[build] pruned stale outputs=%d", removed)
+
+
+_FOLDER_ID_PATTERNS = (
+    re.compile(r"/folders/([a-zA-Z0-9_-]+)"),
+    re.compile(r"[?&]id=([a-zA-Z0-9_-]+)"),
+    re.compile(r"^([a-zA-Z0-9_-]{10,})$"),
+)
+
+
 def extract_folder_id(url: str) -> Optional[str]:
-    patterns = [
-        r"/folders/([a-zA-Z0-9_-]+)",
-        r"[?&]id=([a-zA-Z0-9_-]+)",
-        r"^([a-zA-Z0-9_-]{10,})$",
-    ]
-    for pat in patterns:
-        m = re.search(pat, url)
+    for pat in _FOLDER_ID_PATTERNS:
+        m = pat.search(url)
         if m:
             return m.group(1)
     return None
@@ -243,9 +459,15 @@ def _gdown_supports_arg(fn, name: str) -> bool:
         return False
 
 
-def sync_drive_folder(url: str, out_dir: Path) -> None:
-    if out_dir.exists():
-        shutil.rmtree(out_dir)
+def reset_dir(d: Path) -> None:
+    if d.exists():
+        shutil.rmtree(d)
+    d.mkdir(parents=True, exist_ok=True)
+
+
+def sync_drive_folder(url: str, out_dir: Path, *, jobs: int = 8, retries: int = 4) -> None:
+    import gdown  # sync-only dependency; --build runs never import it
+
     out_dir.mkdir(parents=True, exist_ok=True)
 
     folder_id = extract_folder_id(url)
@@ -256,6 +478,20 @@ def sync_drive_folder(url: str, out_dir: Path) -> None:
             if _gdown_supports_arg(gdown.download_folder, "use_cookies"):
                 kwargs["use_cookies"] = use_cookies
 
+            if _gdown_supports_arg(gdown.download_folder, "skip_download"):
+                # list first, then fetch files concurrently (download_folder is strictly serial)
+                files = (
+                    gdown.download_folder(id=folder_id, skip_download=True, **kwargs)  # type: ignore[arg-type]
+                    if folder_id
+                    else gdown.download_folder(url=url, skip_download=True, **kwargs)  # type: ignore[arg-type]
+                )
+                if files:
+                    LOG.info("[sync] listed %d files, downloading with jobs=%d", len(files), jobs)
+                    sync_drive_files(files, out_dir, use_cookies=use_cookies, jobs=jobs, retries=retries)
+                    return
+                continue
+
+            reset_dir(out_dir)
             paths = (
                 gdown.download_folder(id=folder_id, **kwargs)  # type: ignore[arg-type]
                 if folder_id
@@ -267,21 +503,151 @@ def sync_drive_folder(url: str, out_dir: Path) -> None:
         except Exception as e:
             LOG.warning("[sync] gdown API failed (use_cookies=%s): %s", use_cookies, e)
 
+    reset_dir(out_dir)
     cmd = ["python", "-m", "gdown", "--folder", url, "-O", str(out_dir)]
     LOG.info("[sync] fallback CLI: %s", " ".join(cmd))
     subprocess.check_call(cmd)
 
 
+def load_sync_manifest(out_dir: Path) -> Dict[str, dict]:
+    try:
+        data = json.loads((out_dir / SYNC_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def file_digest(path: Path, algo: str = "md5") -> str:
+    h = hashlib.new(algo)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def sync_drive_files(files: List[Any], out_dir: Path, *, use_cookies: bool, jobs: int, retries: int) -> None:
+    """
+    Download into a staging dir and only replace local files whose content changed,
+    so unchanged files keep their mtime (see is_up_to_date) and stale ones are pruned.
+    Extensions are fixed from the staged bytes first, so normalize_downloaded_files has nothing to rename.
+    """
+    previous = load_sync_manifest(out_dir)
+    manifest: Dict[str, dict] = {}
+    changed = 0
+    # local names handed out this sync; the sync owns out_dir, so older files on disk don't count
+    claimed: Set[str] = set()
+
+    with tempfile.TemporaryDirectory(dir=out_dir.parent, prefix=".drive-staging-") as td:
+        staging = Path(td)
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as ex:
+            futures = [
+                ex.submit(download_drive_file, f, staging / f.id, use_cookies=use_cookies, retries=retries)
+                for f in files
+            ]
+            try:
+                for f, fut in zip(files, futures):
+                    tmp = fut.result()
+                    md5 = file_digest(tmp)
+                    size = tmp.stat().st_size
+                    # fix the extension here, as normalize_downloaded_files would: renaming after the
+                    # compare below would leave the raw name missing and re-publish the file every sync
+                    local_path = unique_path(normalized_path(Path(f.local_path), tmp), claimed)
+                    claimed.add(os.fspath(local_path))
+                    local_rel = Path(os.path.relpath(local_path, out_dir)).as_posix()
+
+                    prev = previous.get(f.id) or {}
+                    unchanged = (
+                        prev.get("path") == f.path
+                        and prev.get("local") == local_rel
+                        and prev.get("md5") == md5
+                        and local_path.is_file()
+                        and local_path.stat().st_size == size
+                    )
+                    if not unchanged:
+                        local_path.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(tmp, local_path)
+                        changed += 1
+                    manifest[f.id] = {
+                        "path": f.path,
+                        "local": local_rel,
+                        "md5": md5,
+                        "size": size,
+                    }
+            except BaseException:
+                ex.shutdown(wait=True, cancel_futures=True)
+                raise
+
+    keep = {Path(p).resolve() for p in claimed}
+    removed = 0
+    for p in list(iter_files(out_dir)):
+        if p.name != SYNC_MANIFEST and p.resolve() not in keep:
+            p.unlink()
+            removed += 1
+
+    write_json(out_dir / SYNC_MANIFEST, manifest)
+    LOG.info("[sync] files=%d changed=%d unchanged=%d removed=%d", len(files), changed, len(files) - changed, removed)
+
+
+def normalized_path(path: Path, staged: Path) -> Path:
+    """path with the extension normalize_downloaded_files would give it, judged from the staged bytes."""
+    if path.suffix.lower() in GSUITE_STUBS:
+        return path
+    kind, _ = sniff_kind_and_error(staged)
+    if kind and path.suffix.lower() != f".{kind}":
+        return path.with_suffix(f".{kind}")
+    return path
+
+
+def download_drive_file(f: Any, dest: Path, *, use_cookies: bool, retries: int) -> Path:
+    import gdown
+
+    attempts = max(1, retries)
+    error: object = None
+    for attempt in range(1, attempts + 1):
+        try:
+            out = gdown.download(
+                url=f"https://drive.google.com/uc?id={f.id}",
+                output=str(dest),
+                quiet=True,
+                use_cookies=use_cookies,
+            )
+            if out:
+                return Path(out)
+            error = "gdown returned no path"
+        except Exception as e:
+            error = e
+
+        if attempt < attempts:
+            delay = 2 ** (attempt - 1)
+            LOG.warning(
+                "[sync] %s failed (attempt %d/%d): %s; retrying in %ds",
+                f.path,
+                attempt,
+                attempts,
+                error,
+                delay,
+            )
+            time.sleep(delay)
+
+    raise RuntimeError(f"Drive download failed after {attempts} attempts: {f.path}: {error}")
+
+
 def read_head(path: Path, n: int = 2048) -> bytes:
+    # raw fd read: no buffered file object for what is a single small read
     try:
-        with path.open("rb") as f:
-            return f.read(n)
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
     except OSError:
         return b""
+    try:
+        return os.read(fd, n)
+    except OSError:
+        return b""
+    finally:
+        os.close(fd)
 
 
 def sniff_kind_and_error(path: Path) -> Tuple[Optional[str], Optional[str]]:
-    head = read_head(path, 2048)
+    head = read_head(path, 8)
     if not head:
         return None, None
 
@@ -291,6 +657,12 @@ def sniff_kind_and_error(path: Path) -> Tuple[Optional[str], Optional[str]]:
     if head.startswith(b"PK\x03\x04"):
         return "docx", None
 
+    # only a possible HTML error page needs more than the signature (for the snippet)
+    peek = head.lstrip()
+    if peek and not peek.startswith(b"<"):
+        return None, None
+    head = read_head(path, 2048)
+
     head_l = head.lstrip().lower()
     if head_l.startswith(b"<!doctype html") or head_l.startswith(b"<html"):
         snippet = head[:300].decode("utf-8", errors="ignore")
@@ -299,27 +671,37 @@ def sniff_kind_and_error(path: Path) -> Tuple[Optional[str], Optional[str]]:
     return None, None
 
 
-def unique_path(target: Path) -> Path:
-    if not target.exists():
+def unique_path(target: Path, taken: Optional[Set[str]] = None) -> Path:
+    """taken: every path known to exist (kept current by the caller); replaces the lexists probe per candidate."""
+    exists = taken.__contains__ if taken is not None else os.path.lexists
+    if not exists(os.fspath(target)):
         return target
-    base = target.with_suffix("")
+    base = str(target.with_suffix(""))
     suf = target.suffix
     for i in range(1, 1000):
-        candidate = Path(f"{base}-{i}{suf}")
-        if not candidate.exists():
-            return candidate
+        candidate = f"{base}-{i}{suf}"
+        if not exists(candidate):
+            return Path(candidate)
     raise SystemExit(f"Could not find unique filename for {target}")
 
 
-def normalize_downloaded_files(root: Path) -> None:
+def normalize_downloaded_files(root: Path) -> List[Path]:
+    """Fix extensions from file signatures; returns every file under root with renames applied."""
     html_errors: List[str] = []
-    files = [p for p in root.rglob("*") if p.is_file()]
+    all_files = list(iter_files(root))
+    renamed: Dict[Path, Path] = {}
+    # the walk already knows every existing name; collisions are resolved in memory, not by probing
+    taken = {os.fspath(p) for p in all_files}
+    files = sorted(
+        (p for p in all_files if p.suffix.lower() not in GSUITE_STUBS),
+        key=lambda x: str(x).lower(),
+    )
 
-    for p in sorted(files, key=lambda x: str(x).lower()):
-        if p.suffix.lower() in {".gdoc", ".gsheet", ".gslides"}:
-            continue
+    # sniffing is pure read I/O and can overlap; renames stay serial below since they mutate the tree
+    with ThreadPoolExecutor(max_workers=SNIFF_WORKERS) as ex:
+        sniffed = list(ex.map(sniff_kind_and_error, files))
 
-        kind, html_error = sniff_kind_and_error(p)
+    for p, (kind, html_error) in zip(files, sniffed):
         if html_error:
             html_errors.append(html_error)
             continue
@@ -327,16 +709,14 @@ def normalize_downloaded_files(root: Path) -> None:
         if not kind:
             continue
 
-        ext = p.suffix.lower()
-        if ext in {".pdf", ".docx"}:
-            if ext != f".{kind}":
-                target = unique_path(p.with_suffix(f".{kind}"))
-                p.rename(target)
-                LOG.info("[normalize] %s -> %s", p, target)
+        if p.suffix.lower() == f".{kind}":
             continue
 
-        target = unique_path(p.with_suffix(f".{kind}"))
+        target = unique_path(p.with_suffix(f".{kind}"), taken)
         p.rename(target)
+        taken.discard(os.fspath(p))
+        taken.add(os.fspath(target))
+        renamed[p] = target
         LOG.info("[normalize] %s -> %s", p, target)
 
     if html_errors:
@@ -347,12 +727,15 @@ def normalize_downloaded_files(root: Path) -> None:
         )
         raise SystemExit(msg)
 
+    return [renamed.get(p, p) for p in all_files]
 
-def assert_has_docs(root: Path) -> None:
-    docx = list(root.rglob("*.docx"))
-    pdf = list(root.rglob("*.pdf"))
+
+def assert_has_docs(files: Iterable[Path]) -> None:
+    exts = [p.suffix.lower() for p in files]
+    docx = exts.count(".docx")
+    pdf = exts.count(".pdf")
     if docx or pdf:
-        LOG.info("[sync] found DOCX=%d PDF=%d", len(docx), len(pdf))
+        LOG.info("[sync] found DOCX=%d PDF=%d", docx, pdf)
         return
     raise SystemExit(
         "No .docx/.pdf found after sync.\n"
@@ -360,17 +743,22 @@ def assert_has_docs(root: Path) -> None:
     )
 
 
+_SLUG_NONALNUM = re.compile(r"[^a-z0-9]+")
+_LEAD_NUM = re.compile(r"^\s*(\d{1,4})\b")
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
-    t = text.strip().lower()
-    t = re.sub(r"[^a-z0-9]+", "-", t)
-    t = re.sub(r"-{2,}", "-", t).strip("-")
-    return t or "item"
+    # one pass: the run-collapsing "+" (which also covers "-") already leaves no "--"
+    return _SLUG_NONALNUM.sub("-", text.strip().lower()).strip("-") or "item"
 
 
+@lru_cache(maxsize=None)
 def safe_rel_dir(rel_dir: Path) -> Path:
-    if str(rel_dir) == ".":
+    # parent-first recursion through the cache: each distinct directory is slugified exactly once
+    if not rel_dir.parts:
         return Path()
-    return Path(*[slugify(p) for p in rel_dir.parts if p and p != "."])
+    return safe_rel_dir(rel_dir.parent) / slugify(rel_dir.name)
 
 
 def title_from_path(p: Path) -> str:
@@ -378,7 +766,7 @@ def title_from_path(p: Path) -> str:
 
 
 def leading_number_key(title: str) -> Tuple[int, str]:
-    m = re.match(r"^\s*(\d{1,4})\b", title)
+    m = _LEAD_NUM.match(title)
     if m:
         return int(m.group(1)), title.lower()
     return 10**9, title.lower()
@@ -393,10 +781,30 @@ def disambiguate_slug(used: Dict[Path, Dict[str, int]], rel_dir: Path, stem: str
     return f"{stem}-{bucket[stem]}"
 
 
-def collect_entries(root: Path) -> List[Entry]:
-    files = sorted([p for p in root.rglob("*") if p.is_file()], key=lambda x: str(x).lower())
+def iter_files(root: Path, suffixes: Optional[Tuple[str, ...]] = None) -> Iterator[Path]:
+    """File walk on os.scandir: file types come from the directory read, no extra stat (unordered)."""
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except FileNotFoundError:
+            continue
+        with it:
+            for d in it:
+                if d.is_dir(follow_symlinks=False):
+                    stack.append(d.path)
+                elif d.is_file() and (suffixes is None or d.name.lower().endswith(suffixes)):
+                    yield Path(d.path)
+
+
+def collect_entries(root: Path, files: Optional[Iterable[Path]] = None) -> List[Entry]:
+    # files: a pre-scanned listing of root (e.g. from normalize_downloaded_files); walked here otherwise
+    if files is None:
+        files = iter_files(root, (".docx", ".pdf"))
+    files = sorted(files, key=lambda x: str(x).lower())
     entries: List[Entry] = []
     used_slugs: Dict[Path, Dict[str, int]] = {}
+    made_dirs: Set[Path] = set()
 
     for f in files:
         ext = f.suffix.lower()
@@ -413,8 +821,10 @@ def collect_entries(root: Path) -> List[Entry]:
 
         out_dir_notes = OUT_NOTES / rel_dir
         out_dir_dl = OUT_DOWNLOADS / rel_dir
-        out_dir_notes.mkdir(parents=True, exist_ok=True)
-        out_dir_dl.mkdir(parents=True, exist_ok=True)
+        if rel_dir not in made_dirs:
+            out_dir_notes.mkdir(parents=True, exist_ok=True)
+            out_dir_dl.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(rel_dir)
 
         if ext == ".docx":
             out_html = out_dir_notes / f"{rel_stem}.html"
@@ -430,95 +840,146 @@ def collect_entries(root: Path) -> List[Entry]:
     return entries
 
 
-def rel_from(frm: Path, to: Path) -> str:
-    return os.path.relpath(to, start=frm.parent).replace("\\", "/")
+def page_up(page: Path) -> str:
+    """The "../" prefix (one per directory between page and docs/) that turns a site path into a page link."""
+    return "../" * (len(page.relative_to(DOCS_DIR).parts) - 1)
+
+
+def site_href(up: str, target: Path) -> str:
+    # plain string work, no os.path.relpath; matches relpath whenever target is outside the page's own folder
+    return up + target.relative_to(DOCS_DIR).as_posix()
+
+
+_CT_TO_EXT = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/gif": "gif",
+    "image/svg+xml": "svg",
+    "image/webp": "webp",
+}
 
 
 def content_type_to_ext(ct: str) -> str:
-    m = {
-        "image/png": "png",
-        "image/jpeg": "jpg",
-        "image/jpg": "jpg",
-        "image/gif": "gif",
-        "image/svg+xml": "svg",
-        "image/webp": "webp",
-    }
-    return m.get(ct, "bin")
+    return _CT_TO_EXT.get(ct, "bin")
+
+
+_COPY_BUF = threading.local()
 
 
-def read_mammoth_image_bytes(image: object) -> bytes:
+def copy_stream(src: Any, dst: Any) -> None:
+    """copyfileobj through one reused 1 MiB buffer per thread (readinto), not a fresh bytes per chunk."""
+    readinto = getattr(src, "readinto", None)
+    if not callable(readinto):
+        shutil.copyfileobj(src, dst, length=1 << 20)
+        return
+
+    view = getattr(_COPY_BUF, "view", None)
+    if view is None:
+        view = _COPY_BUF.view = memoryview(bytearray(1 << 20))
+    while True:
+        n = readinto(view)
+        if not n:
+            break
+        dst.write(view[:n])
+
+
+def write_mammoth_image(image: object, out_path: Path) -> None:
+    # prefer the streaming open(): embedded images are copied in chunks, never held whole
+    open_fn = getattr(image, "open", None)
+    if callable(open_fn):
+        with open_fn() as src, out_path.open("wb") as dst:  # type: ignore[misc]
+            copy_stream(src, dst)
+        return
+
     read_fn = getattr(image, "read", None)
     if callable(read_fn):
         data = read_fn()
         if isinstance(data, (bytes, bytearray)):
-            return bytes(data)
-
-    open_fn = getattr(image, "open", None)
-    if callable(open_fn):
-        with open_fn() as f:  # type: ignore[misc]
-            data = f.read()
-            if isinstance(data, (bytes, bytearray)):
-                return bytes(data)
+            out_path.write_bytes(data)
+            return
 
     raise AttributeError("Unsupported mammoth image object (no read/open)")
 
 
-def wrap_html(*, title: str, body_html: str, home_href: str, lang: str) -> str:
-    soup = BeautifulSoup("", "html.parser")
+_PYVIPS: Any = None
 
-    html = soup.new_tag("html", lang=lang)
-    head = soup.new_tag("head")
-    head.append(soup.new_tag("meta", charset="utf-8"))
-    head.append(soup.new_tag("meta", attrs={"name": "viewport", "content": "width=device-width, initial-scale=1"}))
 
-    t = soup.new_tag("title")
-    t.string = title
-    head.append(t)
+def load_pyvips() -> Any:
+    """pyvips is optional: without it (or without libvips) images are copied verbatim."""
+    global _PYVIPS
+    if _PYVIPS is None:
+        try:
+            import pyvips  # type: ignore[import-not-found]
 
-    style = soup.new_tag("style")
-    style.string = """
-      body{font-family:system-ui,-apple-system,Segoe UI,Roboto,Arial,sans-serif;line-height:1.6;margin:0;background:#fff}
-      .wrap{max-width:980px;margin:0 auto;padding:24px}
-      .topbar{position:sticky;top:0;background:#fff;border-bottom:1px solid #eee}
-      .topbar .wrap{display:flex;gap:12px;align-items:center;justify-content:space-between}
-      .btns{display:flex;gap:10px;flex-wrap:wrap}
-      a.btn{display:inline-block;padding:10px 12px;border:1px solid #ddd;border-radius:12px;text-decoration:none;color:inherit}
-      a.btn:hover{background:#fafafa}
-      .card{border:1px solid #eee;border-radius:16px;padding:16px}
-      ul{padding-left:18px}
-      img{max-width:100%;height:auto}
-      table{border-collapse:collapse;width:100%;overflow-x:auto;display:block}
-      th,td{border:1px solid #ddd;padding:8px}
-      pre,code{background:#f6f8fa;border-radius:8px}
-      pre{padding:12px;overflow:auto}
-      hr{border:none;border-top:1px solid #eee;margin:18px 0}
-      details{border:1px solid #eee;border-radius:16px;padding:12px}
-      summary{cursor:pointer}
-    """
-    head.append(style)
+            _PYVIPS = pyvips
+        except Exception as e:  # ImportError, or OSError when libvips itself is missing
+            LOG.warning("[img] pyvips unavailable, embedded images are not re-encoded: %s", e)
+            _PYVIPS = False
+    return _PYVIPS or None
+
+
+def optimize_image_file(path: Path, content_type: str) -> None:
+    if content_type not in {"image/png", "image/jpeg", "image/jpg"}:
+        return
 
-    body = soup.new_tag("body")
+    pyvips = load_pyvips()
+    if pyvips is None:
+        return
 
-    topbar = soup.new_tag("div", attrs={"class": "topbar"})
-    topwrap = soup.new_tag("div", attrs={"class": "wrap"})
-    title_div = soup.new_tag("div")
-    title_div.string = title
+    tmp = path.with_name(f".{path.name}")
+    try:
+        # sequential access lets libvips stream the decode instead of loading the whole bitmap
+        img = pyvips.Image.new_from_file(str(path), access="sequential")
+        # strip=True drops the EXIF orientation (phone photos), so bake it into the pixels first;
+        # a 90° rotation cannot stream, hence the random-access reload for just those images
+        if img.get_typeof("orientation") and img.get("orientation") not in (0, 1):
+            img = pyvips.Image.new_from_file(str(path), access="random").autorot()
+        if content_type == "image/png":
+            img.pngsave(str(tmp), compression=9, strip=True)
+        else:
+            img.jpegsave(str(tmp), Q=82, strip=True)
+    except pyvips.Error as e:
+        LOG.warning("[img] re-encode failed (%s), keeping original: %s", path.name, e)
+        tmp.unlink(missing_ok=True)
+        return
+
+    # Word embeds are often already tight; never make an image bigger
+    if tmp.stat().st_size < path.stat().st_size:
+        os.replace(tmp, path)
+    else:
+        tmp.unlink()
+
+
+def wrap_html_header(*, title: str, home_href: str, css_href: str, lang: str) -> str:
+    t = html.escape(title, quote=False)
+    return (
+        "<!doctype html>\n"
+        f'<html lang="{html.escape(lang)}"><head>'
+        '<meta charset="utf-8"/>'
+        '<meta content="width=device-width, initial-scale=1" name="viewport"/>'
+        f"<title>{t}</title>"
+        f'<link href="{html.escape(css_href)}" rel="stylesheet"/>'
+        "</head><body>"
+        '<div class="topbar"><div class="wrap">'
+        f"<div>{t}</div>"
+        f'<div class="btns"><a class="btn" href="{html.escape(home_href)}">← Ana sayfa</a></div>'
+        "</div></div>"
+        '<div class="wrap">'
+    )
 
-    btns = soup.new_tag("div", attrs={"class": "btns"})
-    a_home = soup.new_tag("a", href=home_href, attrs={"class": "btn"})
-    a_home.string = "← Ana sayfa"
-    btns.append(a_home)
 
-    topwrap.extend([title_div, btns])
-    topbar.append(topwrap)
+def wrap_html_footer() -> str:
+    return "</div></body></html>"
 
-    content = soup.new_tag("div", attrs={"class": "wrap"})
-    content.append(BeautifulSoup(body_html, "html.parser"))
 
-    body.extend([topbar, content])
-    html.extend([head, body])
-    soup.append(html)
-    return "<!doctype html>\n" + str(soup)
+def wrap_html(*, title: str, body_html: str, home_href: str, css_href: str, lang: str) -> str:
+    # body_html is trusted markup (our own fragments / mammoth output) and is inserted verbatim
+    return (
+        wrap_html_header(title=title, home_href=home_href, css_href=css_href, lang=lang)
+        + body_html
+        + wrap_html_footer()
+    )
 
 
 def soffice_path() -> str:
@@ -540,6 +1001,8 @@ def convert_docx_to_pdf(src_docx: Path, out_pdf: Path) -> None:
         tmp_out = Path(td)
         cmd = [
             exe,
+            # private profile per call: concurrent soffice runs on a shared profile abort
+            f"-env:UserInstallation={(tmp_out / 'profile').as_uri()}",
             "--headless",
             "--nologo",
             "--nofirststartwizard",
@@ -557,62 +1020,122 @@ def convert_docx_to_pdf(src_docx: Path, out_pdf: Path) -> None:
             candidates = list(tmp_out.glob("*.pdf"))
             raise SystemExit(f"DOCX->PDF failed: no PDF produced for {src_docx}. Candidates: {candidates}")
 
-        shutil.move(str(produced), str(out_pdf))
+        # never write through out_pdf: it may be a hardlink shared with the conversion cache, and
+        # shutil.move degrades to copying into the existing file when the temp dir is on another fs
+        tmp_pdf = out_pdf.with_name(f".{out_pdf.name}.tmp")
+        tmp_pdf.unlink(missing_ok=True)
+        shutil.move(str(produced), str(tmp_pdf))
+        os.replace(tmp_pdf, out_pdf)
 
 
 def docx_pdf_target(e: Entry) -> Path:
     return e.out_file.with_suffix(".pdf")
 
 
+def is_up_to_date(e: Entry, *, docx_render: str) -> bool:
+    outputs = [e.out_html, e.out_file]
+    if e.kind == "docx" and docx_render in {"pdf", "both"}:
+        outputs.append(docx_pdf_target(e))
+    try:
+        src_mtime = e.src.stat().st_mtime_ns
+        return all(p.stat().st_mtime_ns >= src_mtime for p in outputs)
+    except OSError:
+        return False
+
+
+def publish_file(src: Path, dst: Path) -> None:
+    """Hardlink src into docs/ (no bytes copied); fall back to a copy across devices."""
+    try:
+        dst.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        # data only (sendfile on Linux); the site does not need the source's metadata
+        shutil.copyfile(src, dst)
+
+
+def build_entry(
+    e: Entry,
+    *,
+    lang: str,
+    docx_render: str,
+    incremental: bool = False,
+    built_from: Optional[dict] = None,
+) -> None:
+    # make-style: skip when the outputs were built from this very source (slugs can move between sources
+    # as files come and go) and every output is at least as new as it
+    if incremental and built_from == source_stamp(e) and is_up_to_date(e, docx_render=docx_render):
+        LOG.info("[build] up to date: %s", e.src)
+        return
+    LOG.info("[build] %s -> %s", e.src, e.out_html)
+    if e.kind == "docx":
+        build_docx(e, lang=lang, docx_render=docx_render)
+    else:
+        build_pdf(e, lang=lang)
+
+
 def build_docx(e: Entry, *, lang: str, docx_render: str) -> None:
-    shutil.copy2(e.src, e.out_file)
+    publish_file(e.src, e.out_file)
+    # one read serves both the cache key and (on a miss) mammoth; huge files are streamed twice instead
+    data: Optional[bytes] = None
+    if e.src.stat().st_size <= DOCX_READ_ONCE_MAX:
+        data = e.src.read_bytes()
+        cache_key = hashlib.sha256(data).hexdigest()
+    else:
+        cache_key = file_digest(e.src, "sha256")
+
+    cache_entry = DOCX_CACHE_DIR / cache_key
 
     pdf_path = docx_pdf_target(e)
     if docx_render in {"pdf", "both"}:
-        convert_docx_to_pdf(e.src, pdf_path)
+        cached_pdf = cache_entry / "document.pdf"
+        if cached_pdf.exists():
+            LOG.info("[docx->pdf] cache hit: %s", e.src)
+            touch_cache_entry(cache_entry)
+            publish_file(cached_pdf, pdf_path)
+            # the hardlink keeps the cache file's old mtime; is_up_to_date needs it newer than the source
+            os.utime(pdf_path)
+        else:
+            convert_docx_to_pdf(e.src, pdf_path)
+            store_cached_file(pdf_path, cached_pdf)
 
-    dl_docx = rel_from(e.out_html, e.out_file)
-    dl_pdf = rel_from(e.out_html, pdf_path) if pdf_path.exists() else ""
+    up = page_up(e.out_html)
+    dl_docx = site_href(up, e.out_file)
+    dl_pdf = site_href(up, pdf_path) if pdf_path.exists() else ""
 
-    html_section = ""
+    body_html: Optional[str] = None
+    messages: List[str] = []
     if docx_render in {"html", "both"}:
         img_dir = OUT_ASSETS / e.rel_dir / e.rel_stem
         img_dir.mkdir(parents=True, exist_ok=True)
-        img_counter = {"i": 0}
-
-        def convert_image(image: mammoth.images.Image) -> dict:
-            img_counter["i"] += 1
-            ext = content_type_to_ext(image.content_type)
-            filename = f"img-{img_counter['i']:03d}.{ext}"
-            out_path = img_dir / filename
-            out_path.write_bytes(read_mammoth_image_bytes(image))
-            return {"src": rel_from(e.out_html, out_path)}
-
-        with e.src.open("rb") as f:
-            result = mammoth.convert_to_html(f, convert_image=mammoth.images.img_element(convert_image))
-
-        messages_html = ""
-        if getattr(result, "messages", None):
-            items = "".join(
-                f"<li>{BeautifulSoup(str(m), 'html.parser').get_text()}</li>"
-                for m in result.messages
-            )
-            messages_html = f"""
-              <div class="card">
-                <p><b>Dönüşüm uyarıları</b></p>
-                <ul>{items}</ul>
-              </div>
-              <hr />
-            """
+        # a rebuilt document may have fewer images than before; never rmtree img_dir itself, it is also
+        # the parent of the asset dirs of a same-named folder's documents (assets/sub for Sub.docx vs Sub/)
+        for p in doc_images(img_dir):
+            p.unlink()
+
+        cache_dir = cache_entry / "html"
+        cached = load_cached_html(cache_dir)
+        if cached is not None:
+            LOG.info("[docx->html] cache hit: %s", e.src)
+            touch_cache_entry(cache_entry)
+            body_html, messages = cached
+            cached_assets = cache_dir / "assets"
+            if cached_assets.is_dir():
+                for p in cached_assets.iterdir():
+                    publish_file(p, img_dir / p.name)
+        else:
+            if data is not None:
+                body_html, messages = convert_docx_to_html(io.BytesIO(data), img_dir)
+            else:
+                with e.src.open("rb") as f:
+                    body_html, messages = convert_docx_to_html(f, img_dir)
+            store_cached_html(cache_dir, body_html, messages, img_dir)
 
-        html_section = f"""
-          <details>
-            <summary>HTML sürümü (yaklaşık biçim)</summary>
-            <hr />
-            {messages_html}
-            {result.value}
-          </details>
-        """
+        # the cached body is page-independent; image links are resolved per output page here. mammoth
+        # escapes '"' in text and attribute values, so ' src="' can only open a real attribute
+        body_html = body_html.replace(f' src="{CACHE_IMG_HREF}/', f' src="{site_href(up, img_dir)}/')
 
     pdf_section = ""
     if docx_render in {"pdf", "both"} and pdf_path.exists():
@@ -632,21 +1155,147 @@ def build_docx(e: Entry, *, lang: str, docx_render: str) -> None:
           <hr />
         """
 
-    body = f"{pdf_section}{html_section}"
-    e.out_html.write_text(
-        wrap_html(
-            title=e.title,
-            body_html=body,
-            home_href=rel_from(e.out_html, DOCS_DIR / "index.html"),
-            lang=lang,
-        ),
-        encoding="utf-8",
-    )
+    # stream the page so the (possibly multi-MB) mammoth HTML is never copied into a larger string
+    with open_atomic(e.out_html) as fp:
+        fp.write(
+            wrap_html_header(
+                title=e.title,
+                home_href=site_href(up, DOCS_DIR / "index.html"),
+                css_href=site_href(up, SITE_CSS),
+                lang=lang,
+            )
+        )
+        fp.write(pdf_section)
+        if body_html is not None:
+            fp.write(docx_html_section_head(messages))
+            fp.write(body_html)
+            fp.write(DOCX_HTML_SECTION_TAIL)
+        fp.write(wrap_html_footer())
+
+
+def convert_docx_to_html(fileobj: BinaryIO, img_dir: Path) -> Tuple[str, List[str]]:
+    """Run mammoth, writing images into img_dir; <img src> values carry the CACHE_IMG_HREF placeholder."""
+    import mammoth  # only HTML rendering needs it; sync-only and --docx-render pdf runs skip the import
+
+    img_counter = {"i": 0}
+
+    # mammoth calls convert_image serially; the libvips re-encode runs on a small pool meanwhile
+    with ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as img_pool:
+        img_jobs = []
+
+        def convert_image(image: mammoth.images.Image) -> dict:
+            img_counter["i"] += 1
+            ext = content_type_to_ext(image.content_type)
+            filename = f"img-{img_counter['i']:03d}.{ext}"
+            out_path = img_dir / filename
+            write_mammoth_image(image, out_path)
+            img_jobs.append(img_pool.submit(optimize_image_file, out_path, image.content_type))
+            return {"src": f"{CACHE_IMG_HREF}/{filename}"}
+
+        result = mammoth.convert_to_html(fileobj, convert_image=mammoth.images.img_element(convert_image))
+
+        for job in img_jobs:
+            job.result()
+
+    return result.value, [str(m) for m in result.messages]
+
+
+def doc_images(img_dir: Path) -> List[Path]:
+    """The img-NNN.* files convert_docx_to_html wrote for one document (not nested asset dirs)."""
+    with os.scandir(img_dir) as it:
+        return [Path(d.path) for d in it if d.name.startswith("img-") and d.is_file(follow_symlinks=False)]
+
+
+def load_cached_html(cache_dir: Path) -> Optional[Tuple[str, List[str]]]:
+    try:
+        body_html = (cache_dir / "body.html").read_text(encoding="utf-8")
+        messages = json.loads((cache_dir / "messages.json").read_bytes())
+    except (OSError, ValueError):
+        return None
+    return body_html, messages
+
+
+def store_cached_html(cache_dir: Path, body_html: str, messages: List[str], img_dir: Path) -> None:
+    """Populate cache_dir atomically: build a sibling temp dir, then rename it into place."""
+    if cache_dir.exists():
+        return
+    cache_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=cache_dir.parent, prefix=f".{cache_dir.name}-"))
+    try:
+        (tmp / "body.html").write_text(body_html, encoding="utf-8")
+        (tmp / "messages.json").write_bytes(dumps_json(messages))
+        assets = tmp / "assets"
+        assets.mkdir()
+        for p in doc_images(img_dir):
+            publish_file(p, assets / p.name)
+        os.replace(tmp, cache_dir)
+    except OSError as ex:
+        # a concurrent worker with the same DOCX won the rename; the cache is best-effort anyway
+        LOG.warning("[cache] could not store %s: %s", cache_dir, ex)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def touch_cache_entry(cache_entry: Path) -> None:
+    # the entry dir's mtime is its last use; prune_docx_cache evicts by it
+    try:
+        os.utime(cache_entry)
+    except OSError:
+        pass
+
+
+def prune_docx_cache(max_age_days: int) -> None:
+    """Evict cache entries neither stored nor hit for max_age_days (skipped up-to-date entries don't count)."""
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    try:
+        it = os.scandir(DOCX_CACHE_DIR)
+    except FileNotFoundError:
+        return
+    with it:
+        for d in it:
+            if d.is_dir(follow_symlinks=False) and d.stat().st_mtime < cutoff:
+                shutil.rmtree(d.path, ignore_errors=True)
+                removed += 1
+    if removed:
+        LOG.info("[cache] evicted entries=%d", removed)
+
+
+def store_cached_file(src: Path, cached: Path) -> None:
+    cached.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cached.parent, prefix=f".{cached.name}-")
+    os.close(fd)
+    try:
+        publish_file(src, Path(tmp))
+        os.replace(tmp, cached)
+    except OSError as ex:
+        LOG.warning("[cache] could not store %s: %s", cached, ex)
+        Path(tmp).unlink(missing_ok=True)
+
+
+def docx_html_section_head(messages: List[str]) -> str:
+    messages_html = ""
+    if messages:
+        items = "".join(f"<li>{html.escape(m)}</li>" for m in messages)
+        messages_html = f"""
+              <div class="card">
+                <p><b>Dönüşüm uyarıları</b></p>
+                <ul>{items}</ul>
+              </div>
+              <hr />
+            """
+
+    return f"""
+          <details>
+            <summary>HTML sürümü (yaklaşık biçim)</summary>
+            <hr />
+            {messages_html}
+            """
 
 
 def build_pdf(e: Entry, *, lang: str) -> None:
-    shutil.copy2(e.src, e.out_file)
-    pdf_href = rel_from(e.out_html, e.out_file)
+    publish_file(e.src, e.out_file)
+    up = page_up(e.out_html)
+    pdf_href = site_href(up, e.out_file)
     body = f"""
       <div class="card">
         <p><a class="btn" href="{pdf_href}">⬇️ PDF indir</a></p>
@@ -655,111 +1304,114 @@ def build_pdf(e: Entry, *, lang: str) -> None:
       <iframe src="{pdf_href}" width="100%" height="900" style="border:1px solid #ddd; border-radius:12px;"></iframe>
       <p><a class="btn" href="{pdf_href}">PDF açılmazsa tıkla</a></p>
     """
-    e.out_html.write_text(
-        wrap_html(
-            title=e.title,
-            body_html=body,
-            home_href=rel_from(e.out_html, DOCS_DIR / "index.html"),
-            lang=lang,
-        ),
-        encoding="utf-8",
-    )
+    with open_atomic(e.out_html) as fp:
+        fp.write(
+            wrap_html(
+                title=e.title,
+                body_html=body,
+                home_href=site_href(up, DOCS_DIR / "index.html"),
+                css_href=site_href(up, SITE_CSS),
+                lang=lang,
+            )
+        )
 
 
 def build_indexes(entries: Iterable[Entry], *, lang: str, site_title: str) -> None:
     entries_l = list(entries)
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-
-    def group_key(e: Entry) -> str:
-        return str(e.rel_dir) if str(e.rel_dir) else "Kök"
-
-    grouped: Dict[str, List[Entry]] = {}
-    for e in entries_l:
-        grouped.setdefault(group_key(e), []).append(e)
-
-    body_lines: List[str] = [
-        f"<h1>{site_title}</h1>",
-        f"<p><i>Otomatik güncellendi: {now}</i></p>",
-        '<div class="card"><p>Okumak için başlığa tıkla, indirmek için sağdaki linki kullan.</p></div>',
-        "<h2>İçerik</h2>",
-    ]
+    now = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
+
+    index_html = DOCS_DIR / "index.html"
+    notes_index = OUT_NOTES / "index.html"
+    downloads_index = OUT_DOWNLOADS / "index.html"
+
+    # one walk over the groups feeds all three index pages
+    with open_atomic(index_html) as root_fp, open_atomic(notes_index) as notes_fp, open_atomic(
+        downloads_index
+    ) as dl_fp:
+        w, wn, wd = root_fp.write, notes_fp.write, dl_fp.write
+
+        w(
+            wrap_html_header(
+                title=site_title,
+                home_href="./index.html",
+                css_href=site_href(page_up(index_html), SITE_CSS),
+                lang=lang,
+            )
+        )
+        w(f"<h1>{site_title}</h1>\n")
+        w(f"<p><i>Otomatik güncellendi: {now}</i></p>\n")
+        w('<div class="card"><p>Okumak için başlığa tıkla, indirmek için sağdaki linki kullan.</p></div>\n')
+        w("<h2>İçerik</h2>\n")
+        wn(
+            wrap_html_header(
+                title="Notes",
+                home_href=site_href(page_up(notes_index), index_html),
+                css_href=site_href(page_up(notes_index), SITE_CSS),
+                lang=lang,
+            )
+        )
+        wd(
+            wrap_html_header(
+                title="Downloads",
+                home_href=site_href(page_up(downloads_index), index_html),
+                css_href=site_href(page_up(downloads_index), SITE_CSS),
+                lang=lang,
+            )
+        )
 
-    if not entries_l:
-        body_lines.append('<div class="card"><p>Henüz Drive’dan DOCX/PDF indirilemedi.</p></div>')
-    else:
-        for gname in sorted(grouped.keys(), key=lambda x: x.lower()):
-            body_lines.append(f"<h3>{gname}</h3>")
-            body_lines.append("<ul>")
-            for e in sorted(grouped[gname], key=lambda x: x.sort_key):
-                read_href = rel_from(DOCS_DIR / "index.html", e.out_html)
-                dl_href = rel_from(DOCS_DIR / "index.html", e.out_file)
+        if not entries_l:
+            w('<div class="card"><p>Henüz Drive’dan DOCX/PDF indirilemedi.</p></div>\n')
+            wn("<div class='card'><p>Boş.</p></div>")
+            wd("<div class='card'><p>Boş.</p></div>")
+
+        for gname, items in group_entries(entries_l):
+            w(f"<h3>{gname}</h3>\n<ul>\n")
+            wn(f"<h2>{gname}</h2>\n<ul>\n")
+            wd(f"<h2>{gname}</h2>\n<ul>\n")
+            sub = dir_href(items[0].rel_dir)
+            for e in items:
+                read_href = f"{sub}{e.out_html.name}"
+                dl_href = f"{sub}{e.out_file.name}"
+                kind_label = e.kind.upper()
                 icon = "📖" if e.kind == "docx" else "📄"
 
                 extra = ""
                 if e.kind == "docx":
-                    pdfp = docx_pdf_target(e)
                     # link even if not exists yet; render mode may skip, but ok.
-                    pdf_href = rel_from(DOCS_DIR / "index.html", pdfp)
-                    extra = f' · <a href="{pdf_href}">⬇️ PDF</a>'
+                    extra = f' · <a href="downloads/{sub}{docx_pdf_target(e).name}">⬇️ PDF</a>'
 
-                body_lines.append(
-                    f'<li>{icon} <a href="{read_href}">{e.title}</a> · <a href="{dl_href}">⬇️ {e.kind.upper()}</a>{extra}</li>'
+                w(
+                    f'<li>{icon} <a href="notes/{read_href}">{e.title}</a> · <a href="downloads/{dl_href}">⬇️ {kind_label}</a>{extra}</li>\n'
                 )
-            body_lines.append("</ul>")
-
-    body_lines += [
-        "<hr />",
-        "<p>"
-        "<a class='btn' href='./notes/index.html'>📚 Notes index</a> "
-        "<a class='btn' href='./downloads/index.html'>⬇️ Downloads index</a>"
-        "</p>",
-    ]
-
-    (DOCS_DIR / "index.html").write_text(
-        wrap_html(title=site_title, body_html="\n".join(body_lines), home_href="./index.html", lang=lang),
-        encoding="utf-8",
-    )
+                wn(f'<li><a href="{read_href}">{e.title}</a></li>\n')
+                wd(f'<li><a href="{dl_href}">{e.title} ({kind_label})</a></li>\n')
+            w("</ul>\n")
+            wn("</ul>\n")
+            wd("</ul>\n")
+
+        w(
+            "<hr />\n"
+            "<p>"
+            "<a class='btn' href='./notes/index.html'>📚 Notes index</a> "
+            "<a class='btn' href='./downloads/index.html'>⬇️ Downloads index</a>"
+            "</p>"
+        )
+        for write in (w, wn, wd):
+            write(wrap_html_footer())
 
-    (OUT_NOTES / "index.html").write_text(
-        wrap_html(
-            title="Notes",
-            body_html=_build_flat_index_html(entries_l, base=OUT_NOTES / "index.html", kind="notes"),
-            home_href=rel_from(OUT_NOTES / "index.html", DOCS_DIR / "index.html"),
-            lang=lang,
-        ),
-        encoding="utf-8",
-    )
 
-    (OUT_DOWNLOADS / "index.html").write_text(
-        wrap_html(
-            title="Downloads",
-            body_html=_build_flat_index_html(entries_l, base=OUT_DOWNLOADS / "index.html", kind="downloads"),
-            home_href=rel_from(OUT_DOWNLOADS / "index.html", DOCS_DIR / "index.html"),
-            lang=lang,
-        ),
-        encoding="utf-8",
-    )
+def dir_href(rel_dir: Path) -> str:
+    """URL prefix of rel_dir below docs/notes or docs/downloads: "" or "a/b/"."""
+    return f"{rel_dir.as_posix()}/" if rel_dir.parts else ""
 
 
-def _build_flat_index_html(entries: List[Entry], *, base: Path, kind: str) -> str:
-    grouped: Dict[str, List[Entry]] = {}
-    for e in entries:
-        key = str(e.rel_dir) if str(e.rel_dir) else "Kök"
-        grouped.setdefault(key, []).append(e)
-
-    lines: List[str] = []
-    for gname in sorted(grouped.keys(), key=lambda x: x.lower()):
-        lines.append(f"<h2>{gname}</h2>")
-        lines.append("<ul>")
-        for e in sorted(grouped[gname], key=lambda x: x.sort_key):
-            if kind == "notes":
-                href = rel_from(base, e.out_html)
-                lines.append(f'<li><a href="{href}">{e.title}</a></li>')
-            else:
-                href = rel_from(base, e.out_file)
-                lines.append(f'<li><a href="{href}">{e.title} ({e.kind.upper()})</a></li>')
-        lines.append("</ul>")
-    return "\n".join(lines) if lines else "<div class='card'><p>Boş.</p></div>"
+def group_name(e: Entry) -> str:
+    return str(e.rel_dir) if e.rel_dir.parts else "Kök"
+
+
+def group_entries(entries: Iterable[Entry]) -> List[Tuple[str, List[Entry]]]:
+    """One-pass grouping; relies on collect_entries() order (directory, then sort_key)."""
+    return [(name, list(items)) for name, items in groupby(entries, key=group_name)]
 
 
 def entry_to_json(e: Optional[Entry]) -> Optional[dict]:
@@ -773,17 +1425,50 @@ def entry_to_json(e: Optional[Entry]) -> Optional[dict]:
     return d
 
 
-def write_manifest(entries: Iterable[Entry], *, status: str, error: Optional[str], current_entry: Optional[Entry]) -> None:
-    entries_l = list(entries)
+def source_stamp(e: Entry) -> Optional[dict]:
+    """What e's outputs are built from; recorded per entry in docs/manifest.json."""
+    try:
+        st = e.src.stat()
+    except OSError:
+        return None
+    return {"src": str(e.src), "size": st.st_size, "mtime_ns": st.st_mtime_ns, "title": e.title}
+
+
+def read_previous_manifest() -> dict:
+    try:
+        data = json.loads((DOCS_DIR / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def previous_sources(manifest: dict) -> Dict[str, dict]:
+    """out_html -> source stamp of the entry that produced it in the previous build."""
+    return {
+        d["out_html"]: d["built_from"]
+        for d in manifest.get("entries") or []
+        if isinstance(d, dict) and "out_html" in d and d.get("built_from")
+    }
+
+
+def write_manifest(
+    entries: List[Entry],
+    *,
+    status: str,
+    error: Optional[str],
+    current_entry: Optional[Entry],
+    options: Optional[Dict[str, Any]] = None,
+) -> None:
     payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "status": status,
+        "options": options,
         "error": error,
         "current_entry": entry_to_json(current_entry),
-        "counts": {"entries": len(entries_l)},
-        "entries": [entry_to_json(e) for e in entries_l],
+        "counts": {"entries": len(entries)},
+        "entries": [{**entry_to_json(e), "built_from": source_stamp(e)} for e in entries],
     }
-    (DOCS_DIR / "manifest.json").write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    write_json(DOCS_DIR / "manifest.json", payload)
 
 
 if __name__ == "__main__":